@@ -0,0 +1,52 @@
+# bot/async_bot.py
+
+import asyncio
+import logging
+from binance import AsyncClient
+from config.settings import BINANCE_TESTNET_BASE_URL, ASYNC_MAX_CONCURRENCY
+
+logger = logging.getLogger(__name__)
+
+class AsyncBasicBot:
+
+    # Asyncio counterpart of BasicBot for queries that fan out over many symbols,
+    # so N requests overlap on one event loop instead of running back to back.
+
+    def __init__(self, client: AsyncClient):
+
+        self.client = client
+        self._semaphore = asyncio.Semaphore(ASYNC_MAX_CONCURRENCY) # bounds in-flight requests
+
+    @classmethod
+    async def create(cls, api_key: str, api_secret: str, testnet: bool = True):
+
+        # Must run on the event loop the bot will be used from. The client is constructed directly
+        # rather than through AsyncClient.create, which pings the spot API and fetches its server time
+        # first: two extra round trips that the unsigned futures ticker calls made here don't need.
+        client = AsyncClient(api_key, api_secret)
+        if testnet:
+            client.FUTURES_URL = BINANCE_TESTNET_BASE_URL
+        return cls(client)
+
+    async def close(self):
+
+        await self.client.close_connection()
+
+    async def _get_price(self, symbol: str) -> float:
+
+        async with self._semaphore:
+            ticker = await self.client.futures_symbol_ticker(symbol=symbol)
+        return float(ticker['price'])
+
+    async def get_prices(self, symbols: list) -> dict:
+
+        # Fetches all prices concurrently; symbols whose request fails are logged and left out.
+        results = await asyncio.gather(*[self._get_price(s) for s in symbols], return_exceptions=True)
+        prices = {}
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error getting market price for {symbol}: {result}")
+            else:
+                prices[symbol] = result
+        logger.info(f"Fetched market prices for {len(prices)}/{len(symbols)} symbols.")
+        return prices
@@ -1,33 +1,122 @@
 # bot/basic_bot.py
 
+import asyncio
 import logging
-from binance import Client, ThreadedWebsocketManager, ThreadedDepthCacheManager
-from binance.exceptions import BinanceAPIException, BinanceRequestException
+import threading
+import time
+try:
+    import orjson
+except ImportError: # optional; responses are decoded with the stdlib json module without it
+    orjson = None
 from config.settings import BINANCE_TESTNET_BASE_URL # Now used directly for FUTURES_URL
-from bot.binance_utils import get_symbol_precision, format_quantity, format_price, get_binance_server_time
+from config.settings import BINANCE_HTTP_POOL_CONNECTIONS, BINANCE_HTTP_POOL_SIZE
+from config.settings import BINANCE_REQUEST_WEIGHT_PER_MINUTE, BINANCE_ORDERS_PER_10_SECONDS
+from config.settings import PRICE_STREAM_ENABLED, PRICE_STREAM_TIMEOUT, PRICE_STREAM_MAX_AGE, BATCH_ORDER_LIMIT
+from config.settings import BINANCE_RECV_WINDOW, TIME_SYNC_INTERVAL, PRECISION_REFRESH_INTERVAL
+from bot.rate_limiter import TokenBucket, ENDPOINT_WEIGHTS
+from bot.retry import retry_binance
+from bot.binance_call import binance_call
+from bot.binance_utils import get_all_symbol_precisions, format_quantity, format_price, get_binance_server_time
 
 logger = logging.getLogger(__name__)
 
+# One BasicBot per (api_key, testnet), so callers share a connection pool, streams and caches
+_INSTANCES: dict = {}
+_INSTANCES_LOCK = threading.Lock()
+
+def __getattr__(name):
+
+    # The binance SDK (aiohttp, websockets, ...) is imported on first use rather than with this module,
+    # so importing the bot stays cheap. Names formerly imported here still resolve, e.g. basic_bot.Client.
+    if name in ('Client', 'ThreadedWebsocketManager'):
+        import binance
+        return getattr(binance, name)
+    if name == 'FastClient':
+        from bot.fast_client import FastClient
+        return FastClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def _orjson_response_hook(response, *args, **kwargs):
+
+    # Swaps this response's json() for orjson, which decodes large payloads like exchange info several times faster.
+    # Only responses from the bot's own session are affected.
+    response.json = lambda **_: orjson.loads(response.content)
+    return response
+
 class BasicBot:
     
-    def __init__(self, api_key: str, api_secret: str, testnet: bool = True):
+    def __init__(self, api_key: str, api_secret: str, testnet: bool = True, verbose_startup: bool = False):
         
         self.api_key = api_key
         self.api_secret = api_secret
         self.testnet = testnet # Store this flag
+        self.verbose_startup = verbose_startup # Fetch and log full account info while connecting
         self.client = None
+        self.twm = None # WebSocket manager feeding the price cache
+        self._prices = {} # symbol -> (latest mid price from the bookTicker stream, monotonic receive time)
+        self._price_events = {} # symbol -> Event set on the first push
+        self._price_streams = {} # symbol -> socket name, for unsubscribing
+        self._price_refs = {} # symbol -> subscriber count
+        self._price_lock = threading.Lock()
         self.symbol_precisions = {} # Cache for symbol precision info
+        self._precision_refreshed_at = float('-inf') # monotonic time of the last unknown-symbol refresh
+        self._time_offset = 0 # Binance server time minus local time, in ms
+        self._stop_event = threading.Event() # stops background threads on close()
+        self._async_bot = None # AsyncBasicBot for get_prices, created on first use
+        self._async_loop = None # event loop it runs on, in a background thread
+        self._async_lock = threading.Lock()
+        # Client-side throttles for request weight (per minute) and order count (per 10 seconds)
+        self._weight_bucket = TokenBucket(BINANCE_REQUEST_WEIGHT_PER_MINUTE, BINANCE_REQUEST_WEIGHT_PER_MINUTE / 60)
+        self._order_bucket = TokenBucket(BINANCE_ORDERS_PER_10_SECONDS, BINANCE_ORDERS_PER_10_SECONDS / 10)
         self._connect_client()
 
+    @classmethod
+    def get(cls, api_key: str, api_secret: str, testnet: bool = True, **kwargs):
+
+        # Returns the shared bot for these credentials, creating it on first use.
+        # The client is safe to use from several threads, so one instance serves them all.
+        # Extra keyword arguments (e.g. verbose_startup) only apply when the instance is created and are
+        # ignored afterwards. A different api_secret for an existing api_key raises ValueError.
+        # A bot that failed to connect is closed and returned but not shared, so the next call tries again.
+        key = (api_key, testnet)
+        with _INSTANCES_LOCK:
+            instance = _INSTANCES.get(key)
+            if instance is not None:
+                if instance.api_secret != api_secret:
+                    raise ValueError("A BasicBot for this API key already exists with a different API secret.")
+                return instance
+            instance = cls(api_key, api_secret, testnet, **kwargs)
+            if instance.client:
+                _INSTANCES[key] = instance
+                return instance
+        # Outside the lock, which close() takes; stops anything started before the connection failed
+        instance.close()
+        return instance
+
     def _connect_client(self):
         
+        from requests.adapters import HTTPAdapter
+        from binance.exceptions import BinanceAPIException, BinanceRequestException
+        from bot.fast_client import FastClient
+
         if not self.api_key or not self.api_secret:
             logger.error("API Key or Secret is missing. Cannot connect to Binance.")
             return
 
         try:
-            self.client = Client(self.api_key, self.api_secret)
+            self.client = FastClient(self.api_key, self.api_secret)
             logger.info("Binance Client initialized (no specific base_url in constructor).")
+            # Signed requests get their recvWindow from here; python-binance overwrites any per-call value.
+            # The clock offset applied alongside it is set by _sync_time below.
+            self.client.REQUEST_RECVWINDOW = BINANCE_RECV_WINDOW
+
+            # Reuse keep-alive connections across calls instead of re-handshaking TLS
+            adapter = HTTPAdapter(pool_connections=BINANCE_HTTP_POOL_CONNECTIONS,
+                                  pool_maxsize=BINANCE_HTTP_POOL_SIZE, max_retries=0)
+            self.client.session.mount('https://', adapter)
+            self.client.session.headers['Connection'] = 'keep-alive'
+            if orjson:
+                self.client.session.hooks['response'].append(_orjson_response_hook)
 
             if self.testnet:
                 self.client.FUTURES_URL = BINANCE_TESTNET_BASE_URL
@@ -36,14 +125,23 @@ class BasicBot:
                 logger.info(f"Futures API base URL using default production: {self.client.FUTURES_URL}")
 
 
-            self.client.futures_ping()
+            self._request(self.client.futures_ping)
             logger.info("Successfully pinged Binance Futures API.")
 
-            server_time = get_binance_server_time(self.client)
-            if server_time:
-                logger.info(f"Binance Server Time: {server_time}")
+            # Load every symbol's precision up front so order placement never waits on exchange info
+            self.symbol_precisions = get_all_symbol_precisions(self.client, testnet=self.testnet,
+                                                               limiter=self._weight_bucket)
+            self._sync_used_weight()
+            logger.info(f"Loaded precision for {len(self.symbol_precisions)} symbols.")
+
+            if self._sync_time():
+                threading.Thread(target=self._time_sync_loop, name='binance-time-sync', daemon=True).start()
 
-            logger.info(f"Account Information: {self.get_account_info()}")
+            if self.verbose_startup:
+                logger.info(f"Account Information: {self.get_account_info()}")
+
+            if PRICE_STREAM_ENABLED:
+                self._start_price_streams()
         except BinanceAPIException as e:
             logger.error(f"Binance API Exception during connection: {e.code} - {e.message}")
             self.client = None
@@ -54,66 +152,300 @@ class BasicBot:
             logger.error(f"An unexpected error occurred during connection: {e}")
             self.client = None
 
-    def _get_or_fetch_precision(self, symbol: str):
-        
-        if symbol not in self.symbol_precisions:
+    def _sync_time(self) -> bool:
+
+        # Measures the local clock's offset from Binance server time and applies it to signed requests,
+        # so drifting clocks don't get orders rejected with -1021 (outside of the recvWindow).
+        local_before = int(time.time() * 1000)
+        server_time = get_binance_server_time(self.client, limiter=self._weight_bucket)
+        local_after = int(time.time() * 1000)
+        self._sync_used_weight()
+        if not server_time:
+            return False
+
+        # Assume the server stamped the response halfway through the round trip
+        self._time_offset = server_time - (local_before + local_after) // 2
+        self.client.timestamp_offset = self._time_offset
+        logger.info(f"Binance Server Time: {server_time} (local clock offset: {self._time_offset} ms)")
+        return True
+
+    def _time_sync_loop(self):
+
+        while not self._stop_event.wait(TIME_SYNC_INTERVAL):
             if self.client:
-                precisions = get_symbol_precision(self.client, symbol)
-                if precisions:
-                    self.symbol_precisions[symbol] = precisions
-                else:
-                    logger.warning(f"Could not retrieve precision for {symbol}. "
-                                    f"Orders might fail due to incorrect formatting.")
+                self._sync_time()
+
+    def _start_price_streams(self):
+
+        # Starts the WebSocket manager; prices fall back to REST if it cannot be started.
+        try:
+            from binance import ThreadedWebsocketManager
+            self.twm = ThreadedWebsocketManager(api_key=self.api_key, api_secret=self.api_secret,
+                                                testnet=self.testnet)
+            self.twm.start()
+            logger.info("WebSocket manager started for market price streams.")
+        except Exception as e:
+            logger.warning(f"Could not start WebSocket manager, market prices will use REST: {e}")
+            self.twm = None
+
+    def _on_book_ticker(self, msg: dict):
+
+        # Runs on the WebSocket thread for every bookTicker push.
+        if msg.get('e') == 'error':
+            # The stream dropped: forget cached prices so callers use REST until it recovers
+            logger.warning(f"Market price stream error: {msg.get('m')}")
+            self._prices.clear()
+            return
+        data = msg.get('data', msg)
+        symbol = data.get('s')
+        if not symbol:
+            return
+        self._prices[symbol] = ((float(data['b']) + float(data['a'])) / 2, time.monotonic())
+        event = self._price_events.get(symbol)
+        if event:
+            event.set()
+
+    def subscribe_market_price(self, symbol: str) -> bool:
+
+        # Adds a reference to the symbol's bookTicker stream, starting it on the first subscription.
+        twm = self.twm
+        if not twm:
+            return False
+        with self._price_lock:
+            self._price_refs[symbol] = self._price_refs.get(symbol, 0) + 1
+            if symbol in self._price_streams:
+                return True
+            self._price_events[symbol] = threading.Event()
+            try:
+                self._price_streams[symbol] = twm.start_symbol_ticker_futures_socket(
+                    callback=self._on_book_ticker, symbol=symbol)
+            except Exception as e:
+                # Usually the manager's own client failed to start. It can't recover, and every further
+                # subscribe would block for seconds first, so drop it and use REST from now on.
+                logger.warning(f"Could not subscribe to {symbol} price stream, market prices will use REST: {e}")
+                self.twm = None
+                self._prices.clear()
+                self._price_events.clear()
+                self._price_streams.clear()
+                self._price_refs.clear()
+                failed = True
             else:
-                logger.error("Binance client not connected. Cannot fetch symbol precision.")
-                return None
-        return self.symbol_precisions.get(symbol)
+                failed = False
+        if failed:
+            try:
+                twm.stop()
+            except Exception as e:
+                logger.warning(f"Error stopping WebSocket manager: {e}")
+            return False
+        logger.info(f"Subscribed to {symbol} bookTicker stream.")
+        return True
+
+    def unsubscribe_market_price(self, symbol: str):
+
+        # Drops a reference to the symbol's stream and stops it once nobody uses it.
+        with self._price_lock:
+            refs = self._price_refs.get(symbol, 0) - 1
+            if refs > 0:
+                self._price_refs[symbol] = refs
+                return
+            self._price_refs.pop(symbol, None)
+            self._price_events.pop(symbol, None)
+            self._prices.pop(symbol, None)
+            stream = self._price_streams.pop(symbol, None)
+        if stream and self.twm:
+            self.twm.stop_socket(stream)
+            logger.info(f"Unsubscribed from {symbol} bookTicker stream.")
+
+    def _fresh_price(self, symbol: str):
+
+        # The streamed price if it arrived within PRICE_STREAM_MAX_AGE seconds, else None.
+        entry = self._prices.get(symbol)
+        if entry is None:
+            return None
+        price, received_at = entry
+        if time.monotonic() - received_at > PRICE_STREAM_MAX_AGE:
+            logger.debug(f"Streamed {symbol} price is older than {PRICE_STREAM_MAX_AGE}s, ignoring it.")
+            return None
+        return price
+
+    def _get_streamed_price(self, symbol: str):
+
+        # Returns a fresh stream price, subscribing and waiting for the first push if needed.
+        # None means the caller should use REST (no stream, no push yet, or the last push is stale).
+        price = self._fresh_price(symbol)
+        if price is not None or symbol in self._price_streams:
+            return price
+        # A symbol missing from exchange info has no stream to wait for; REST reports the error at once
+        if symbol not in self.symbol_precisions or not self.subscribe_market_price(symbol):
+            return None
+        event = self._price_events.get(symbol)
+        if event and not event.wait(PRICE_STREAM_TIMEOUT):
+            # Drop the silent subscription so later calls don't wait on it again
+            logger.warning(f"No {symbol} price received within {PRICE_STREAM_TIMEOUT}s, falling back to REST.")
+            self.unsubscribe_market_price(symbol)
+            return None
+        return self._fresh_price(symbol)
+
+    def close(self):
+
+        # Stops the WebSocket manager, its price streams, the async price client and the clock re-sync thread.
+        with _INSTANCES_LOCK:
+            if _INSTANCES.get((self.api_key, self.testnet)) is self:
+                del _INSTANCES[(self.api_key, self.testnet)]
+        self._stop_event.set()
+        if self.twm:
+            self.twm.stop()
+            self.twm = None
+        with self._price_lock:
+            self._prices.clear()
+            self._price_events.clear()
+            self._price_streams.clear()
+            self._price_refs.clear()
+        self._close_async_bot()
+
+    def _get_async_bot(self):
+
+        # Returns the shared AsyncBasicBot, starting its event loop thread and client on first use,
+        # so get_prices pays the client/session setup once rather than on every call.
+        with self._async_lock:
+            if self._async_bot is None:
+                from bot.async_bot import AsyncBasicBot
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name='binance-async', daemon=True).start()
+                try:
+                    self._async_bot = asyncio.run_coroutine_threadsafe(
+                        AsyncBasicBot.create(self.api_key, self.api_secret, self.testnet), loop).result()
+                except Exception:
+                    loop.call_soon_threadsafe(loop.stop)
+                    raise
+                self._async_loop = loop
+            return self._async_bot, self._async_loop
+
+    def _close_async_bot(self):
+
+        with self._async_lock:
+            async_bot, loop = self._async_bot, self._async_loop
+            self._async_bot = self._async_loop = None
+        if async_bot is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(async_bot.close(), loop).result(timeout=5)
+        except Exception as e:
+            logger.warning(f"Error closing async price client: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+
+    def _sync_used_weight(self):
+
+        # Reconciles the weight bucket with the usage Binance reported on the last response.
+        response = getattr(self.client, 'response', None)
+        if response is None:
+            return
+        used_weight = response.headers.get('X-MBX-USED-WEIGHT-1M')
+        if used_weight:
+            self._weight_bucket.reconcile(int(used_weight))
 
+    @retry_binance()
+    def _request(self, method, orders: int = 0, **params):
+
+        # Calls a futures_* client method once the weight (and order) buckets allow it.
+        # Rate-limit rejections are retried with backoff; the buckets are charged again on each attempt.
+        self._weight_bucket.acquire(ENDPOINT_WEIGHTS.get(method.__name__, 1))
+        if orders:
+            self._order_bucket.acquire(orders)
+        try:
+            return method(**params)
+        finally:
+            self._sync_used_weight()
+
+    def _get_or_fetch_precision(self, symbol: str):
+        
+        precisions = self.symbol_precisions.get(symbol)
+        if precisions:
+            return precisions
+        if not self.client:
+            logger.error("Binance client not connected. Cannot fetch symbol precision.")
+            return None
+
+        # Unknown symbol: it may have been listed after the last fetch, so refresh, but at most once
+        # per PRECISION_REFRESH_INTERVAL (a full exchange info fetch plus a disk rewrite)
+        now = time.monotonic()
+        if now - self._precision_refreshed_at >= PRECISION_REFRESH_INTERVAL:
+            self._precision_refreshed_at = now
+            refreshed = get_all_symbol_precisions(self.client, testnet=self.testnet, refresh=True,
+                                                  limiter=self._weight_bucket)
+            self._sync_used_weight()
+            if refreshed:
+                self.symbol_precisions = refreshed
+        precisions = self.symbol_precisions.get(symbol)
+        if not precisions:
+            logger.warning(f"Could not retrieve precision for {symbol}. "
+                            f"Orders might fail due to incorrect formatting.")
+        return precisions
+
+    @binance_call(default={})
     def get_account_info(self) -> dict:
         
         if not self.client:
             logger.error("Binance client not connected. Cannot get account info.")
             return {}
-        try:
-            info = self.client.futures_account()
-            logger.info("Successfully retrieved futures account information.")
-            for asset in info['assets']:
-                logger.info(f"Asset: {asset.get('asset')}, Wallet Balance: {asset.get('walletBalance')}, "
-                            f"Cross Wallet Balance: {asset.get('crossWalletBalance')}")
-            logger.info(f"Total Initial Margin: {info.get('totalInitialMargin')}")
-            return info
-        except BinanceAPIException as e:
-            logger.error(f"Binance API Exception getting account info: {e.code} - {e.message}")
-        except BinanceRequestException as e:
-            logger.error(f"Binance Request Exception getting account info: {e}")
-        except Exception as e:
-            logger.error(f"An unexpected error occurred getting account info: {e}")
-        return {}
+        info = self._request(self.client.futures_account)
+        logger.info("Successfully retrieved futures account information.")
+        logger.debug("assets=%s", info.get('assets'))
+        logger.info("account: margin=%s unrealized=%s",
+                    info.get('totalInitialMargin'), info.get('totalUnrealizedProfit'))
+        return info
 
+    @binance_call(default=0.0)
     def get_market_price(self, symbol: str) -> float:
         
         if not self.client:
             logger.error("Binance client not connected. Cannot get market price.")
             return 0.0
-        try:
-            ticker = self.client.futures_symbol_ticker(symbol=symbol)
-            price = float(ticker['price'])
-            logger.info(f"Current market price for {symbol}: {price}")
+
+        price = self._get_streamed_price(symbol)
+        if price is not None:
+            logger.info(f"Current market price for {symbol}: {price} (stream)")
             return price
-        except BinanceAPIException as e:
-            logger.error(f"Binance API Exception getting market price for {symbol}: {e.code} - {e.message}")
-        except BinanceRequestException as e:
-            logger.error(f"Binance Request Exception getting market price for {symbol}: {e}")
-        except Exception as e:
-            logger.error(f"An unexpected error occurred getting market price for {symbol}: {e}")
-        return 0.0
 
-    def place_order(self, symbol: str, side: str, order_type: str, quantity: float, price: float = None):
-        
+        ticker = self._request(self.client.futures_symbol_ticker, symbol=symbol)
+        price = float(ticker['price'])
+        logger.info(f"Current market price for {symbol}: {price}")
+        return price
+
+    def get_prices(self, symbols: list) -> dict:
+
+        # Prices for many symbols at once: fresh streamed prices are used as-is and the rest are
+        # fetched concurrently through a long-lived AsyncBasicBot. Blocking wrapper for CLI/synchronous use.
         if not self.client:
-            logger.error("Binance client not connected. Cannot place order.")
-            return None
+            logger.error("Binance client not connected. Cannot get market prices.")
+            return {}
 
+        prices = {}
+        for symbol in symbols:
+            price = self._fresh_price(symbol)
+            if price is not None:
+                prices[symbol] = price
+        missing = [s for s in symbols if s not in prices]
+        if not missing:
+            return prices
+
+        try:
+            if len(missing) == 1:
+                # Nothing to overlap: one request on the pooled keep-alive session is cheapest
+                ticker = self._request(self.client.futures_symbol_ticker, symbol=missing[0])
+                prices[missing[0]] = float(ticker['price'])
+                return prices
+
+            self._weight_bucket.acquire(ENDPOINT_WEIGHTS['futures_symbol_ticker'] * len(missing))
+            async_bot, loop = self._get_async_bot()
+            prices.update(asyncio.run_coroutine_threadsafe(async_bot.get_prices(missing), loop).result())
+        except Exception as e:
+            logger.error(f"An unexpected error occurred getting market prices: {e}")
+        return prices
+
+    def _build_order_params(self, symbol: str, side: str, order_type: str, quantity: float, price: float = None):
+
+        # Validates one order and formats it to the symbol's precision. Returns None if it is invalid.
         if order_type not in ["MARKET", "LIMIT"]:
             logger.error(f"Invalid order type: {order_type}. Must be 'MARKET' or 'LIMIT'.")
             return None
@@ -130,7 +462,7 @@ class BasicBot:
         price_precision = precisions['price_precision']
 
         formatted_quantity = format_quantity(quantity, quantity_precision)
-        logger.info(f"Original quantity: {quantity}, Formatted quantity: {formatted_quantity}")
+        logger.info("Original quantity: %s, Formatted quantity: %s", quantity, formatted_quantity)
 
         params = {
             'symbol': symbol,
@@ -139,7 +471,7 @@ class BasicBot:
             'quantity': formatted_quantity,
         }
 
-        if order_type == Client.ORDER_TYPE_LIMIT:
+        if order_type == "LIMIT":
             if price is None:
                 logger.error("Price is required for LIMIT orders.")
                 return None
@@ -147,28 +479,82 @@ class BasicBot:
             formatted_price = format_price(price, price_precision)
             params['price'] = formatted_price
             params['timeInForce'] = 'GTC' 
-            logger.info(f"Original price: {price}, Formatted price: {formatted_price}")
+            logger.info("Original price: %s, Formatted price: %s", price, formatted_price)
 
-        logger.info(f"Attempting to place {order_type} order: {params}")
+        return params
 
-        try:
-            order = self.client.futures_create_order(**params)
-            logger.info(f"Order placed successfully: {order}")
-            return order
-        except BinanceAPIException as e:
-            logger.error(f"Binance API Exception placing order: {e.code} - {e.message} (params: {params})")
-        except BinanceRequestException as e:
-            logger.error(f"Binance Request Exception placing order: {e} (params: {params})")
-        except Exception as e:
-            logger.error(f"An unexpected error occurred placing order: {e} (params: {params})")
-        return None
+    @binance_call(default=None)
+    def _submit_order(self, params: dict):
+
+        logger.info("Attempting to place %s order: %s", params['type'], params)
+        order = self._request(self.client.futures_create_order, orders=1, **params)
+        logger.info("Order placed successfully: %s", order)
+        return order
+
+    @binance_call(default=None)
+    def _submit_batch(self, batch: list) -> list:
+
+        # Returns None if the whole request failed
+        logger.info("Attempting to place batch of %d orders: %s", len(batch), batch)
+        # batchOrders must be the only parameter: python-binance slices it back out of the urlencoded
+        # query string assuming it comes first
+        responses = self._request(self.client.futures_place_batch_order, orders=len(batch), batchOrders=batch)
+
+        # Each entry is either the created order or an {code, msg} error for that order alone
+        results = []
+        for params, response in zip(batch, responses):
+            if 'code' in response:
+                logger.error("Batch order rejected: %s - %s (params: %s)", response.get('code'), response.get('msg'), params)
+                results.append(None)
+            else:
+                logger.info("Order placed successfully: %s", response)
+                results.append(response)
+        return results
+
+    def place_orders(self, orders: list) -> list:
+
+        # Places several orders, each a dict of place_order's arguments (symbol, side, order_type,
+        # quantity and, for LIMIT, price). Every order is validated before any is sent; if one is
+        # invalid nothing is placed. Orders go out in batches of up to BATCH_ORDER_LIMIT per request.
+        # Returns one entry per order, in order: the Binance response, or None if it failed.
+        if not self.client:
+            logger.error("Binance client not connected. Cannot place order.")
+            return [None] * len(orders)
+
+        batch = []
+        for order in orders:
+            try:
+                params = self._build_order_params(**order)
+            except TypeError as e: # missing or unexpected keys, e.g. 'type' instead of 'order_type'
+                logger.error(f"Malformed order {order}: {e}")
+                params = None
+            if params is None:
+                logger.error("Invalid order %s. None of the %d orders were placed.", order, len(orders))
+                return [None] * len(orders)
+            batch.append(params)
+
+        if len(batch) == 1:
+            return [self._submit_order(batch[0])]
+
+        results = []
+        for i in range(0, len(batch), BATCH_ORDER_LIMIT):
+            chunk = batch[i:i + BATCH_ORDER_LIMIT]
+            results.extend(self._submit_batch(chunk) or [None] * len(chunk))
+        return results
+
+    def place_order(self, symbol: str, side: str, order_type: str, quantity: float, price: float = None):
+        
+        return self.place_orders([{'symbol': symbol, 'side': side, 'order_type': order_type,
+                                   'quantity': quantity, 'price': price}])[0]
 
     def place_market_order(self, symbol: str, side: str, quantity: float):
         
-        logger.info(f"Placing MARKET {side} order for {quantity} {symbol}")
-        return self.place_order(symbol, side, Client.ORDER_TYPE_MARKET, quantity)
+        logger.info("Placing MARKET %s order for %s %s", side, quantity, symbol)
+        return self.place_orders([{'symbol': symbol, 'side': side, 'order_type': "MARKET",
+                                   'quantity': quantity}])[0]
 
     def place_limit_order(self, symbol: str, side: str, quantity: float, price: float):
         
-        logger.info(f"Placing LIMIT {side} order for {quantity} {symbol} at {price}")
-        return self.place_order(symbol, side, Client.ORDER_TYPE_LIMIT, quantity, price)
\ No newline at end of file
+        logger.info("Placing LIMIT %s order for %s %s at %s", side, quantity, symbol, price)
+        return self.place_orders([{'symbol': symbol, 'side': side, 'order_type': "LIMIT",
+                                   'quantity': quantity, 'price': price}])[0]
\ No newline at end of file
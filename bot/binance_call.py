@@ -0,0 +1,23 @@
+import copy
+import functools
+import logging
+
+def binance_call(default=None):
+
+    # Decorator for functions that call the Binance API. Any exception (BinanceAPIException,
+    # BinanceRequestException, network or parsing errors) is logged under the function's own logger
+    # and a copy of `default` is returned, so callers see a falsy result instead of a traceback.
+    # Stack it above @retry_binance so rate-limit errors are retried before they are swallowed here.
+
+    def decorator(func):
+        logger = logging.getLogger(func.__module__)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                logger.error("Error in %s: %s", func.__qualname__, e)
+                return copy.copy(default)
+        return wrapper
+    return decorator
@@ -1,68 +1,166 @@
+import json
 import logging
+import os
+import threading
+import time
 from decimal import Decimal, ROUND_DOWN
-from binance.exceptions import BinanceAPIException, BinanceRequestException
+from config.settings import EXCHANGE_INFO_CACHE_PATH, EXCHANGE_INFO_CACHE_TTL
+from bot.rate_limiter import ENDPOINT_WEIGHTS
+from bot.retry import retry_binance
+from bot.binance_call import binance_call
 
 logger = logging.getLogger(__name__)
 
-def get_symbol_precision(client, symbol: str) -> dict:
-    
-    # Fetches the precision rules for a given symbol from Binance exchange info.
-    
+_CACHE_LOCK = threading.Lock()
+
+# In-process index per network: testnet flag -> ({symbol: precisions}, monotonic load time).
+# Built once per TTL so lookups skip the disk cache as well.
+_SYMBOL_INDEX: dict = {}
+
+def _call(method, limiter=None, **params):
+
+    # Calls a futures_* client method, charging its weight to the optional limiter.
+    if limiter:
+        limiter.acquire(ENDPOINT_WEIGHTS.get(method.__name__, 1))
+    return method(**params)
+
+def _cache_path(testnet: bool) -> str:
+
+    # Testnet and mainnet list different symbols and precisions, so each gets its own cache file.
+    return EXCHANGE_INFO_CACHE_PATH.format(network='testnet' if testnet else 'mainnet')
+
+def _load_cache(testnet: bool):
+
+    # Reads the on-disk precision map and its age in seconds. The map is empty if the file is missing,
+    # unreadable or older than the TTL.
+    path = _cache_path(testnet)
+    try:
+        age = time.time() - os.path.getmtime(path)
+        if age >= EXCHANGE_INFO_CACHE_TTL:
+            return {}, 0.0
+        with open(path, 'r') as f:
+            return json.load(f), max(age, 0.0)
+    except (OSError, ValueError):
+        return {}, 0.0
+
+def _save_cache(precisions: dict, testnet: bool):
+
+    # Writes the precision map atomically so concurrent readers never see a partial file.
+    path = _cache_path(testnet)
     try:
-        exchange_info = client.futures_exchange_info()
-        for s in exchange_info['symbols']:
-            if s['symbol'] == symbol:
-                price_precision = s['pricePrecision']
-                quantity_precision = s['quantityPrecision']
-                logger.info(f"Fetched precision for {symbol}: "
-                            f"Price Precision = {price_precision}, "
-                            f"Quantity Precision = {quantity_precision}")
-                return {
-                    'price_precision': price_precision,
-                    'quantity_precision': quantity_precision
-                }
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(precisions, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not write exchange info cache to {path}: {e}")
+
+def _fresh_index(testnet: bool):
+
+    # The network's in-process index if it was loaded within the TTL, else None.
+    entry = _SYMBOL_INDEX.get(testnet)
+    if entry is not None and time.monotonic() - entry[1] < EXCHANGE_INFO_CACHE_TTL:
+        return entry[0]
+    return None
+
+def _set_index(precisions: dict, testnet: bool, age: float = 0.0) -> dict:
+
+    # `age` is how old the data already is (e.g. the disk cache's age), so it expires with its source.
+    _SYMBOL_INDEX[testnet] = (precisions, time.monotonic() - age)
+    return precisions
+
+@binance_call(default={})
+@retry_binance()
+def get_all_symbol_precisions(client, testnet: bool = True, refresh: bool = False, limiter=None) -> dict:
+
+    # Returns {symbol: {price_precision, quantity_precision}} for every futures symbol.
+    # Served from the in-process index or the disk cache when fresh; otherwise fetched once from
+    # exchange info and re-cached in both.
+    # Pass refresh=True to bypass the cache, e.g. to pick up a symbol listed since the last fetch.
+    # `testnet` must match the network the client talks to; each network is cached separately.
+    # An optional TokenBucket limiter is charged only when the exchange info is actually requested.
+
+    if not refresh:
+        precisions = _fresh_index(testnet)
+        if precisions is not None:
+            return precisions
+        precisions, age = _load_cache(testnet)
+        if precisions:
+            return _set_index(precisions, testnet, age)
+
+    # Only one thread rebuilds the cache; the others pick up its result once the lock is released.
+    with _CACHE_LOCK:
+        if not refresh:
+            precisions = _fresh_index(testnet)
+            if precisions is not None:
+                return precisions
+            precisions, age = _load_cache(testnet)
+            if precisions:
+                return _set_index(precisions, testnet, age)
+
+        exchange_info = _call(client.futures_exchange_info, limiter=limiter)
+        precisions = {
+            s['symbol']: {
+                'price_precision': s['pricePrecision'],
+                'quantity_precision': s['quantityPrecision']
+            }
+            for s in exchange_info['symbols']
+        }
+        logger.info(f"Fetched precision for {len(precisions)} symbols from exchange info.")
+        _save_cache(precisions, testnet)
+        return _set_index(precisions, testnet)
+
+@binance_call(default={})
+def get_symbol_precision(client, symbol: str, testnet: bool = True, limiter=None) -> dict:
+    
+    # Looks up the precision rules for a given symbol in the exchange info index (a single dict hit once loaded).
+
+    precisions = get_all_symbol_precisions(client, testnet=testnet, limiter=limiter).get(symbol)
+    if not precisions:
         logger.warning(f"Symbol '{symbol}' not found in exchange info.")
         return {}
-    except (BinanceAPIException, BinanceRequestException) as e:
-        logger.error(f"Binance API/Request Exception fetching symbol precision for {symbol}: {e}")
-        return {}
-    except Exception as e:
-        logger.error(f"An unexpected error occurred fetching symbol precision for {symbol}: {e}")
-        return {}
+    logger.info(f"Fetched precision for {symbol}: "
+                f"Price Precision = {precisions['price_precision']}, "
+                f"Quantity Precision = {precisions['quantity_precision']}")
+    return precisions
     
 
 
-def format_quantity(quantity: float, precision: int) -> str:
+_QUANTIZERS: dict = {} # precision -> Decimal exponent, e.g. 3 -> Decimal('0.001')
 
-    # Formats a quantity to the specified decimal precision, rounding down.
+def _q(precision: int) -> Decimal:
+
+    quantizer = _QUANTIZERS.get(precision)
+    if quantizer is None:
+        quantizer = _QUANTIZERS[precision] = Decimal(1).scaleb(-precision)
+    return quantizer
+
+def _format(value: float, precision: int) -> str:
+
+    # Formats a value to the specified decimal precision, rounding down.
     if precision < 0:
         factor = 10**abs(precision)
-        return str(int(quantity // factor * factor))
+        return str(int(value // factor * factor))
+
+    return str(Decimal(str(value)).quantize(_q(precision), rounding=ROUND_DOWN))
 
-    fmt_str = '0.' + '0' * precision
-    return str(Decimal(str(quantity)).quantize(Decimal(fmt_str), rounding=ROUND_DOWN))
+def format_quantity(quantity: float, precision: int) -> str:
+
+    # Formats a quantity to the specified decimal precision, rounding down.
+    return _format(quantity, precision)
 
 def format_price(price: float, precision: int) -> str:
 
     # Formats a price to the specified decimal precision, rounding down.
-    if precision < 0:
-        factor = 10**abs(precision)
-        return str(int(price // factor * factor))
+    return _format(price, precision)
 
-    fmt_str = '0.' + '0' * precision
-    return str(Decimal(str(price)).quantize(Decimal(fmt_str), rounding=ROUND_DOWN))
-
-def get_binance_server_time(client) -> int:
+@binance_call(default=0)
+@retry_binance()
+def get_binance_server_time(client, limiter=None) -> int:
     
     # Fetches the current Binance server time in milliseconds, useful for ensuring accurate timestamps in signed API requests.
 
-    try:
-        server_time = client.futures_time()['serverTime']
-        logger.info(f"Fetched Binance server time: {server_time} ms")
-        return server_time
-    except (BinanceAPIException, BinanceRequestException) as e:
-        logger.error(f"Binance API/Request Exception fetching server time: {e}")
-        return 0
-    except Exception as e:
-        logger.error(f"An unexpected error occurred fetching server time: {e}")
-        return 0
\ No newline at end of file
+    server_time = _call(client.futures_time, limiter=limiter)['serverTime']
+    logger.info(f"Fetched Binance server time: {server_time} ms")
+    return server_time
\ No newline at end of file
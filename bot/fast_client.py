@@ -0,0 +1,23 @@
+# bot/fast_client.py
+
+import hashlib
+import hmac
+from binance import Client
+
+class FastClient(Client):
+
+    # Client that signs requests from a precomputed HMAC-SHA256 key context: each signature copies
+    # the keyed state instead of re-deriving it from the secret. Signatures are identical.
+
+    def __init__(self, api_key: str = None, api_secret: str = None, *args, **kwargs):
+
+        self._hmac_ctx = hmac.new(api_secret.encode('utf-8'), digestmod=hashlib.sha256) if api_secret else None
+        super().__init__(api_key, api_secret, *args, **kwargs)
+
+    def _hmac_signature(self, query_string: str) -> str:
+
+        if self._hmac_ctx is None:
+            return super()._hmac_signature(query_string)
+        ctx = self._hmac_ctx.copy()
+        ctx.update(query_string.encode('utf-8'))
+        return ctx.hexdigest()
@@ -0,0 +1,59 @@
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+class TokenBucket:
+
+    # Thread-safe token bucket used to keep request weight and order count under Binance's limits.
+    # Tokens refill continuously at refill_per_sec up to capacity; acquire() blocks until enough are available.
+
+    def __init__(self, capacity: float, refill_per_sec: float):
+
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+
+        # Must be called with the lock held.
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.refill_per_sec)
+        self._last_refill = now
+
+    def acquire(self, tokens: float = 1):
+
+        # Takes `tokens` from the bucket, sleeping until they have refilled if necessary.
+        tokens = min(tokens, self.capacity)
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.refill_per_sec
+            logger.debug(f"Rate limit reached, waiting {wait:.3f}s for {tokens} tokens.")
+            time.sleep(wait)
+
+    def reconcile(self, used: float):
+
+        # Aligns the bucket with the usage reported by the server (e.g. X-MBX-USED-WEIGHT-1M),
+        # which also counts requests made by other processes sharing the same IP.
+        with self._lock:
+            self._refill()
+            self._tokens = max(0.0, min(self._tokens, self.capacity - used))
+
+
+# Request weight of each futures endpoint the bot calls (see Binance USD-M Futures API docs)
+ENDPOINT_WEIGHTS = {
+    'futures_ping': 1,
+    'futures_time': 1,
+    'futures_exchange_info': 1,
+    'futures_account': 5,
+    'futures_symbol_ticker': 1,
+    'futures_create_order': 1,
+    'futures_place_batch_order': 5,
+}
@@ -0,0 +1,61 @@
+import functools
+import logging
+import random
+import time
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_STATUS_CODES = (429,)
+RATE_LIMIT_ERROR_CODES = (-1003, -1015) # TOO_MANY_REQUESTS, TOO_MANY_ORDERS
+# 418 means the IP was auto-banned for ignoring 429s. It is never retried, whatever its error code:
+# a ban can last minutes to days, and an order retried after it lifts would execute at whatever
+# the price is by then
+IP_BANNED_STATUS_CODE = 418
+
+def is_rate_limited(e: Exception) -> bool:
+
+    # True if the exception is Binance telling us to slow down rather than a logic error.
+    from binance.exceptions import BinanceAPIException
+    return isinstance(e, BinanceAPIException) and e.status_code != IP_BANNED_STATUS_CODE and (
+        e.status_code in RATE_LIMIT_STATUS_CODES or e.code in RATE_LIMIT_ERROR_CODES
+    )
+
+def _retry_after(e: Exception):
+
+    # Seconds requested by the Retry-After header of the failed response, if any.
+    response = getattr(e, 'response', None)
+    if response is None:
+        return None
+    try:
+        return float(response.headers.get('Retry-After'))
+    except (TypeError, ValueError):
+        return None
+
+def retry_binance(max_attempts: int = 3, base: float = 0.5, cap: float = 8.0):
+
+    # Decorator that retries a Binance call when it is rejected for rate limiting.
+    # Sleeps for the server's Retry-After when given, otherwise for a jittered exponential backoff
+    # capped at `cap` seconds. A Retry-After longer than `cap` is not waited out: the error is raised
+    # instead. Any other exception, or the last rate-limit error, propagates unchanged.
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(max_attempts):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    if not is_rate_limited(e) or attempt == max_attempts - 1:
+                        raise
+                    delay = _retry_after(e)
+                    if delay is not None and delay > cap:
+                        logger.error(f"Rate limited on {func.__name__} with Retry-After {delay:.0f}s "
+                                     f"(more than {cap}s), not retrying.")
+                        raise
+                    if delay is None:
+                        delay = min(cap, base * 2 ** attempt) + random.random() * 0.1
+                    logger.warning(f"Rate limited on {func.__name__} ({e.status_code}/{e.code}), "
+                                   f"retrying in {delay:.2f}s (attempt {attempt + 2}/{max_attempts}).")
+                    time.sleep(delay)
+        return wrapper
+    return decorator
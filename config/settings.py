@@ -4,16 +4,63 @@ import logging
 
 
 logger = logging.getLogger(__name__)
-load_dotenv()
 
+# Credentials from the process environment; load() also picks up values from .env
 BINANCE_API_KEY = os.getenv('BINANCE_API_KEY')
 BINANCE_API_SECRET = os.getenv('BINANCE_API_SECRET')
 BINANCE_TESTNET_BASE_URL = "https://testnet.binancefuture.com"
 
-if not BINANCE_API_KEY or not BINANCE_API_SECRET:
-    logger.error("BINANCE_API_KEY or BINANCE_API_SECRET not found in environment variables.")
-    logger.info("Please setup your API Credentials")
+def load():
+
+    # Reads .env into the environment and refreshes the credentials from it.
+    # Kept out of import time so importing the settings never touches the filesystem.
+    global BINANCE_API_KEY, BINANCE_API_SECRET
+    load_dotenv()
+    BINANCE_API_KEY = os.getenv('BINANCE_API_KEY')
+    BINANCE_API_SECRET = os.getenv('BINANCE_API_SECRET')
+
+    if not BINANCE_API_KEY or not BINANCE_API_SECRET:
+        logger.error("BINANCE_API_KEY or BINANCE_API_SECRET not found in environment variables.")
+        logger.info("Please setup your API Credentials")
+
+# HTTPS connection pool for the REST client. Sized well above requests' default of 10 so
+# bursts of ticker/order calls reuse keep-alive connections instead of opening new TLS sessions.
+BINANCE_HTTP_POOL_CONNECTIONS = 32 # number of host pools kept
+BINANCE_HTTP_POOL_SIZE = 64 # max connections kept alive per host
+
+# Client-side rate limits, kept at or below Binance's so requests never trigger 429/418 responses
+BINANCE_REQUEST_WEIGHT_PER_MINUTE = 1200
+BINANCE_ORDERS_PER_10_SECONDS = 50
 
 # Default Trading Parameters
 DEFAULT_SYMBOL = "BTCUSDT"
-DEFAULT_QUANTITY = 0.001
\ No newline at end of file
+DEFAULT_QUANTITY = 0.001
+
+# Signed requests: how long (ms) Binance accepts them after their timestamp, and how often (s)
+# the local clock offset to Binance server time is re-measured
+BINANCE_RECV_WINDOW = 5000
+TIME_SYNC_INTERVAL = 1800
+
+# Max orders per futures_place_batch_order request (Binance allows 5)
+BATCH_ORDER_LIMIT = 5
+
+# Serve get_market_price from WebSocket bookTicker streams (REST only when False)
+PRICE_STREAM_ENABLED = True
+
+# Seconds get_market_price waits for the first WebSocket bookTicker push before falling back to REST
+PRICE_STREAM_TIMEOUT = 5
+
+# Seconds a streamed price stays valid. python-binance drops receive timeouts silently, so a half-open
+# socket just stops updating; older prices are ignored and fetched over REST instead.
+PRICE_STREAM_MAX_AGE = 10
+
+# Max concurrent requests when AsyncBasicBot fans out over many symbols
+ASYNC_MAX_CONCURRENCY = 16
+
+# Min seconds between exchange info refreshes triggered by an unknown symbol, so typos or a caller
+# looping on a bad symbol don't refetch it on every call
+PRECISION_REFRESH_INTERVAL = 60
+
+# Exchange info precision cache (shared across processes), one file per network
+EXCHANGE_INFO_CACHE_PATH = os.path.join('logs', 'exchange_info_{network}.json')
+EXCHANGE_INFO_CACHE_TTL = 3600 # seconds
\ No newline at end of file
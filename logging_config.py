@@ -1,13 +1,20 @@
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 import os
+import queue
 
 def setup_logging() :
     """
     Sets up the logging configuration for the application.
     Logs messages to a file (rotating) and to the console.
+    Records are handed to a queue and written by a background listener thread,
+    so callers never block on console or disk I/O.
     """
 
+    # Thread info is never used by the formatter; skip collecting it for every record
+    logging.logThreads = False
+
     log_dir = 'logs'
     os.makedirs(log_dir, exist_ok=True)
     log_file_path = os.path.join(log_dir, 'trading_bot.log')
@@ -20,7 +27,6 @@ def setup_logging() :
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
 
     file_handler = RotatingFileHandler(
         log_file_path,
@@ -30,7 +36,13 @@ def setup_logging() :
 
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+
+    log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+    listener.start()
+    # Drain queued records before the interpreter exits
+    atexit.register(listener.stop)
 
     logging.getLogger('binance.client').setLevel(logging.WARNING)
     logging.getLogger('urllib3').setLevel(logging.WARNING)
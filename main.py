@@ -1,12 +1,18 @@
+import gc
 import os 
 import logging
+import re
 import sys
+try:
+    import readline
+except ImportError: # not available on Windows; input works without completion
+    readline = None
 
 from bot.basic_bot import BasicBot
-from config.settings import BINANCE_API_KEY, BINANCE_API_SECRET, DEFAULT_SYMBOL, DEFAULT_QUANTITY
+from config import settings
+from config.settings import DEFAULT_SYMBOL, DEFAULT_QUANTITY
 from logging_config import setup_logging
 
-setup_logging()
 logger = logging.getLogger(__name__)
 
 def get_user_input(prompt: str, type_func=str, validator=None, error_message="Invalid input. Please try again."):
@@ -38,14 +44,150 @@ def get_user_input(prompt: str, type_func=str, validator=None, error_message="In
             logger.error(f"An unexpected error occurred during input: {e}")
             print("An unexpected error occurred. Please try again.")
 
+# Input validators, built once rather than on every menu iteration
+_CHOICE = lambda x: 1 <= x <= 5
+_POS_FLOAT = lambda x: x > 0
+_SIDE = lambda s: s.upper() in {'BUY', 'SELL'}
+_SYMBOL_RE = re.compile(r'^[A-Z0-9]{5,20}$').match # e.g. BTCUSDT, 1000000BOBUSDT
+
+def _sym_completer(symbols):
+    # Completer over the given symbols; readline calls it with state 0, 1, 2... until it returns None
+    matches = []
+    def complete(text, state):
+        nonlocal matches
+        if state == 0:
+            prefix = text.upper()
+            matches = [s for s in symbols if s.startswith(prefix)]
+        return matches[state] if state < len(matches) else None
+    return complete
+
+def _prompt_symbol(bot):
+    # Tab-completes against the bot's symbols (its network's exchange info) while this prompt is active
+    if readline:
+        readline.set_completer(_sym_completer(sorted(bot.symbol_precisions)))
+    try:
+        return get_user_input(f"Enter trading symbol (e.g., {DEFAULT_SYMBOL}): ", type_func=str.upper,
+                              validator=_SYMBOL_RE,
+                              error_message="Symbol must be 5-20 letters or digits, e.g. BTCUSDT.")
+    finally:
+        if readline:
+            readline.set_completer(None)
+
+def _place_market(bot):
+    print("\n--- Place Market Order ---")
+    symbol = _prompt_symbol(bot)
+    side = get_user_input("Enter order side (BUY/SELL): ",
+                          validator=_SIDE,
+                          error_message="Side must be 'BUY' or 'SELL'.").upper()
+    quantity = get_user_input(f"Enter quantity (e.g., {DEFAULT_QUANTITY}): ", type_func=float,
+                              validator=_POS_FLOAT,
+                              error_message="Quantity must be a positive number.")
+
+    print(f"\nAttempting to place MARKET {side} order for {quantity} {symbol}...")
+    order_response = bot.place_market_order(symbol, side, quantity)
+    if order_response:
+        print("\nMARKET Order Placed Successfully!")
+        print(f"Order ID: {order_response.get('orderId')}")
+        print(f"Symbol: {order_response.get('symbol')}")
+        print(f"Side: {order_response.get('side')}")
+        print(f"Type: {order_response.get('type')}")
+        print(f"Status: {order_response.get('status')}")
+        if order_response.get('fills'):
+            print(f"Executed Price: {order_response['fills'][0].get('price')}")
+    else:
+        print("\nFailed to place MARKET order. Check logs for details.")
+
+def _place_limit(bot):
+    print("\n--- Place Limit Order ---")
+    symbol = _prompt_symbol(bot)
+    side = get_user_input("Enter order side (BUY/SELL): ",
+                          validator=_SIDE,
+                          error_message="Side must be 'BUY' or 'SELL'.").upper()
+    quantity = get_user_input(f"Enter quantity (e.g., {DEFAULT_QUANTITY}): ", type_func=float,
+                              validator=_POS_FLOAT,
+                              error_message="Quantity must be a positive number.")
+    price = get_user_input("Enter limit price: ", type_func=float,
+                           validator=_POS_FLOAT,
+                           error_message="Price must be a positive number.")
+
+    print(f"\nAttempting to place LIMIT {side} order for {quantity} {symbol} at {price}...")
+    order_response = bot.place_limit_order(symbol, side, quantity, price)
+    if order_response:
+        print("\nLIMIT Order Placed Successfully!")
+        print(f"Order ID: {order_response.get('orderId')}")
+        print(f"Symbol: {order_response.get('symbol')}")
+        print(f"Side: {order_response.get('side')}")
+        print(f"Type: {order_response.get('type')}")
+        print(f"Price: {order_response.get('price')}")
+        print(f"Status: {order_response.get('status')}")
+    else:
+        print("\nFailed to place LIMIT order. Check logs for details.")
+
+def _show_account(bot):
+    print("\n--- Account Information ---")
+    account_info = bot.get_account_info()
+    if account_info:
+        print("\nAccount Details:")
+        for asset in account_info.get('assets', []):
+            print(f"  Asset: {asset.get('asset')}")
+            print(f"    Wallet Balance: {asset.get('walletBalance')}")
+            print(f"    Available Balance: {asset.get('availableBalance')}")
+            print(f"    Margin Balance: {asset.get('marginBalance')}")
+        print(f"  Total Initial Margin: {account_info.get('totalInitialMargin')}")
+        print(f"  Total Unrealized Profit: {account_info.get('totalUnrealizedProfit')}")
+    else:
+        print("\nFailed to retrieve account information. Check logs for details.")
+
+def _show_price(bot):
+    print("\n--- Get Market Price ---")
+    symbol = _prompt_symbol(bot)
+    market_price = bot.get_market_price(symbol)
+    if market_price > 0:
+        print(f"\nCurrent Market Price for {symbol}: {market_price}")
+    else:
+        print(f"\nFailed to retrieve market price for {symbol}. Check logs for details.")
+
+def _exit(bot):
+    print("Exiting Trading Bot :)")
+    logger.info("Trading Bot CLI exited")
+    return False # stops the menu loop; run_cli closes the bot
+
+# Menu choice -> handler; a handler returning False ends the CLI
+HANDLERS = {
+    1: _place_market,
+    2: _place_limit,
+    3: _show_account,
+    4: _show_price,
+    5: _exit,
+}
+
 def run_cli():
     """
     Runs the command-line interface for the trading bot.
     """
+    # Logging, .env and readline are set up here rather than at import so importing main stays cheap
+    setup_logging()
+    settings.load()
+    if readline:
+        readline.parse_and_bind('tab: complete')
+
+    # Faster event loop for the async price fetches and WebSocket streams, where available (not on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    # Fewer gen-0 collections during request bursts; the CLI holds few long-lived objects
+    gc.set_threshold(50000, 50, 50)
+
     logger.info("Starting Binance Futures Trading Bot CLI...")
 
+    # Full account details at startup cost an extra weight-5 request, so they are opt-in
+    verbose_startup = '--verbose' in sys.argv[1:] or os.getenv('BOT_VERBOSE_STARTUP') == '1'
+
     # Initialize the bot
-    bot = BasicBot(api_key=BINANCE_API_KEY, api_secret=BINANCE_API_SECRET, testnet=True)
+    bot = BasicBot.get(api_key=settings.BINANCE_API_KEY, api_secret=settings.BINANCE_API_SECRET, testnet=True,
+                   verbose_startup=verbose_startup)
 
     if not bot.client:
         logger.critical("Bot failed to connect to Binance. Exiting CLI.")
@@ -53,103 +195,26 @@ def run_cli():
         print("See logs/trading_bot.log for more details.")
         sys.exit(1)
 
-    while True:
-        print("\n--- Trading Bot Menu ---")
-        print("1. Place Market Order")
-        print("2. Place Limit Order")
-        print("3. Get Account Info")
-        print("4. Get Market Price")
-        print("5. Exit")
-        print("------------------------")
-
-        choice = get_user_input("Enter your choice (1-5): ", type_func=int,
-                                validator=lambda x: 1 <= x <= 5,
-                                error_message="Choice must be between 1 and 5.")
-
-        if choice == 1: # Place Market Order
-            print("\n--- Place Market Order ---")
-            symbol = get_user_input(f"Enter trading symbol (e.g., {DEFAULT_SYMBOL}): ",
-                                    validator=lambda s: len(s) > 0,
-                                    error_message="Symbol cannot be empty.").upper()
-            side = get_user_input("Enter order side (BUY/SELL): ",
-                                validator=lambda s: s.upper() in ["BUY", "SELL"],
-                                error_message="Side must be 'BUY' or 'SELL'.").upper()
-            quantity = get_user_input(f"Enter quantity (e.g., {DEFAULT_QUANTITY}): ", type_func=float,
-                                    validator=lambda q: q > 0,
-                                    error_message="Quantity must be a positive number.")
-
-            print(f"\nAttempting to place MARKET {side} order for {quantity} {symbol}...")
-            order_response = bot.place_market_order(symbol, side, quantity)
-            if order_response:
-                print("\nMARKET Order Placed Successfully!")
-                print(f"Order ID: {order_response.get('orderId')}")
-                print(f"Symbol: {order_response.get('symbol')}")
-                print(f"Side: {order_response.get('side')}")
-                print(f"Type: {order_response.get('type')}")
-                print(f"Status: {order_response.get('status')}")
-                if order_response.get('fills'):
-                    print(f"Executed Price: {order_response['fills'][0].get('price')}")
-            else:
-                print("\nFailed to place MARKET order. Check logs for details.")
-
-        elif choice == 2: # Place Limit Order
-            print("\n--- Place Limit Order ---")
-            symbol = get_user_input(f"Enter trading symbol (e.g., {DEFAULT_SYMBOL}): ",
-                                    validator=lambda s: len(s) > 0,
-                                    error_message="Symbol cannot be empty.").upper()
-            side = get_user_input("Enter order side (BUY/SELL): ",
-                                  validator=lambda s: s.upper() in ["BUY", "SELL"],
-                                  error_message="Side must be 'BUY' or 'SELL'.").upper()
-            quantity = get_user_input(f"Enter quantity (e.g., {DEFAULT_QUANTITY}): ", type_func=float,
-                                      validator=lambda q: q > 0,
-                                      error_message="Quantity must be a positive number.")
-            price = get_user_input("Enter limit price: ", type_func=float,
-                                   validator=lambda p: p > 0,
-                                   error_message="Price must be a positive number.")
-
-            print(f"\nAttempting to place LIMIT {side} order for {quantity} {symbol} at {price}...")
-            order_response = bot.place_limit_order(symbol, side, quantity, price)
-            if order_response:
-                print("\nLIMIT Order Placed Successfully!")
-                print(f"Order ID: {order_response.get('orderId')}")
-                print(f"Symbol: {order_response.get('symbol')}")
-                print(f"Side: {order_response.get('side')}")
-                print(f"Type: {order_response.get('type')}")
-                print(f"Price: {order_response.get('price')}")
-                print(f"Status: {order_response.get('status')}")
-            else:
-                print("\nFailed to place LIMIT order. Check logs for details.")
-
-        elif choice == 3: # Get Account Info
-            print("\n--- Account Information ---")
-            account_info = bot.get_account_info()
-            if account_info:
-                print("\nAccount Details:")
-                for asset in account_info.get('assets', []):
-                    print(f"  Asset: {asset.get('asset')}")
-                    print(f"    Wallet Balance: {asset.get('walletBalance')}")
-                    print(f"    Available Balance: {asset.get('availableBalance')}")
-                    print(f"    Margin Balance: {asset.get('marginBalance')}")
-                print(f"  Total Initial Margin: {account_info.get('totalInitialMargin')}")
-                print(f"  Total Unrealized Profit: {account_info.get('totalUnrealizedProfit')}")
-            else:
-                print("\nFailed to retrieve account information. Check logs for details.")
-
-        elif choice == 4: # Get Market Price
-            print("\n--- Get Market Price ---")
-            symbol = get_user_input(f"Enter trading symbol (e.g., {DEFAULT_SYMBOL}): ",
-                                    validator=lambda s: len(s) > 0,
-                                    error_message="Symbol cannot be empty.").upper()
-            market_price = bot.get_market_price(symbol)
-            if market_price > 0:
-                print(f"\nCurrent Market Price for {symbol}: {market_price}")
-            else:
-                print(f"\nFailed to retrieve market price for {symbol}. Check logs for details.")
-
-        elif choice == 5:
-            print("Exiting Trading Bot :)")
-            logger.info("Trading Bot CLI exited")
-            break
+    # The WebSocket manager runs on a non-daemon thread, so the bot must be closed on every way out
+    # (Ctrl+C, Ctrl+D, errors) or the interpreter would wait on it forever
+    try:
+        while True:
+            print("\n--- Trading Bot Menu ---")
+            print("1. Place Market Order")
+            print("2. Place Limit Order")
+            print("3. Get Account Info")
+            print("4. Get Market Price")
+            print("5. Exit")
+            print("------------------------")
+
+            choice = get_user_input("Enter your choice (1-5): ", type_func=int,
+                                    validator=_CHOICE,
+                                    error_message="Choice must be between 1 and 5.")
+
+            if HANDLERS[choice](bot) is False:
+                break
+    finally:
+        bot.close()
 
 if __name__ == "__main__":
     run_cli()
\ No newline at end of file